@@ -1,47 +1,68 @@
 
 import streamlit as st
 import pandas as pd
-from requests import get
-from bs4 import BeautifulSoup as bs
+import asyncio
+import multiprocessing
+import aiohttp
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from page_parser import parse_page
 import base64
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 import sqlite3
 import os
+import time
 
-# --- PAGE CONFIGURATION ---
-st.set_page_config(page_title="CoinAfrique Scraper", layout="wide")
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = 'string'
 
-# --- APP HEADER & DESCRIPTION (RESTORED) ---
-st.markdown("<h1 style='text-align: center; color: black;'>MY DATA APP - Coinafrique</h1>", unsafe_allow_html=True)
+# Spawned parse workers (see get_parse_pool) re-run this script as __mp_main__;
+# every page-level Streamlit call is skipped there
+IS_PARSE_WORKER = __name__ == '__mp_main__'
 
-st.markdown('''
+if not IS_PARSE_WORKER:
+    # --- PAGE CONFIGURATION ---
+    st.set_page_config(page_title="CoinAfrique Scraper", layout="wide")
+
+    # --- APP HEADER & DESCRIPTION (RESTORED) ---
+    st.markdown("<h1 style='text-align: center; color: black;'>MY DATA APP - Coinafrique</h1>", unsafe_allow_html=True)
+
+    st.markdown('''
 This app performs webscraping of data from Coinafrique across multiple pages.
-You can scrape with BeautifulSoup, download raw WebScraper exports, view a cleaned dashboard, and give feedback.
-* **Python libraries:** base64, pandas, streamlit, requests, bs4, sqlite3
+You can scrape live listings with aiohttp and selectolax, download raw WebScraper exports, view a cleaned dashboard, and give feedback.
+* **Python libraries:** base64, pandas, streamlit, aiohttp, selectolax, sqlite3
 * **Data source:** https://sn.coinafrique.com
-''')
+    ''')
 
 # --- HELPER FUNCTIONS ---
-def add_bg_from_local(image_file):
-    if os.path.exists(image_file):
-        with open(image_file, "rb") as image_file:
-            encoded_string = base64.b64encode(image_file.read())
-        st.markdown(
-        f'''
+# The background image and stylesheet only need to be read and encoded once per process
+@st.cache_resource
+def _bg_css(image_file):
+    with open(image_file, "rb") as f:
+        encoded_string = base64.b64encode(f.read())
+    return f'''
         <style>
         .stApp {{
             background-image: url(data:image/{"jpg"};base64,{encoded_string.decode()});
             background-size: cover
         }}
         </style>
-        ''',
-        unsafe_allow_html=True
-        )
+        '''
+
+def add_bg_from_local(image_file):
+    if os.path.exists(image_file):
+        st.markdown(_bg_css(image_file), unsafe_allow_html=True)
 
+# Cached so repeated renders of the download button reuse the encoded bytes
+@st.cache_data
 def convert_df(df):
-    return df.to_csv(index=False).encode('utf-8')
+    d = df.copy()
+    for c in d.select_dtypes('object'):
+        d[c] = d[c].astype(STRING_DTYPE)
+    return d.to_csv(index=False, lineterminator='\n').encode('utf-8')
 
 def load(dataframe, title, key, key1):
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -60,23 +81,49 @@ def load(dataframe, title, key, key1):
                 key=key
             )
 
+@st.cache_resource
+def _local_css(file_name):
+    with open(file_name) as f:
+        return f'<style>{f.read()}</style>'
+
 def local_css(file_name):
     if os.path.exists(file_name):
-        with open(file_name) as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+        st.markdown(_local_css(file_name), unsafe_allow_html=True)
 
 # --- OPTIMIZED DATA LOADER (CACHED) ---
-@st.cache_data
+# cache_resource hands back the shared DataFrame without a pickle round-trip,
+# so callers that mutate the result must work on a .copy()
+@st.cache_resource
 def load_csv_data(filename):
+    # Prefer the Parquet copy written by scrape_data; the CSV stays for downloads
+    parquet_file = filename.replace('.csv', '.parquet')
+    if os.path.exists(parquet_file):
+        try:
+            return pd.read_parquet(parquet_file)
+        except Exception:
+            pass
     if os.path.exists(filename):
         try:
-            return pd.read_csv(filename)
-        except Exception as e:
-            return pd.DataFrame()
+            return pd.read_csv(filename, engine='pyarrow', dtype_backend='pyarrow')
+        except Exception:
+            # pyarrow is missing or stricter than the C engine on this file (e.g. ArrowInvalid)
+            try:
+                return pd.read_csv(filename)
+            except Exception:
+                return pd.DataFrame()
     return pd.DataFrame()
 
+# Top-n value counts are memoized per (file, column) so dashboard reruns skip the re-hash
+@st.cache_data
+def top_counts(filename, col, n=10):
+    df = load_csv_data(filename)
+    return df[col].value_counts().head(n)
+
 # --- OPTIMIZED DASHBOARD FUNCTION (LITE) ---
-def plot_category_stats_lite(df, category_name):
+POSSIBLE_ADDR = frozenset(['address', 'location', 'ville', 'lieu', 'adresse', 'region'])
+POSSIBLE_NAMES = frozenset(['type_item', 'type_clothes', 'type_shoes', 'name', 'description', 'titre'])
+
+def plot_category_stats_lite(df, category_name, filename):
     st.markdown(f"### Analysis: {category_name}")
     
     if df.empty:
@@ -84,18 +131,15 @@ def plot_category_stats_lite(df, category_name):
         return
 
     # 1. SMART COLUMN DETECTION
-    price_col = next((c for c in df.columns if 'price' in c.lower() or 'prix' in c.lower()), None)
-    possible_addr = ['address', 'location', 'ville', 'lieu', 'adresse', 'region']
-    address_col = next((c for c in df.columns if c.lower().strip() in possible_addr), None)
-    possible_names = ['type_item', 'type_clothes', 'type_shoes', 'name', 'description', 'titre']
-    item_col = next((c for c in df.columns if c.lower().strip() in possible_names), df.columns[0])
+    lc = {c: c.lower().strip() for c in df.columns}
+    price_col = next((c for c, l in lc.items() if 'price' in l or 'prix' in l), None)
+    address_col = next((c for c, l in lc.items() if l in POSSIBLE_ADDR), None)
+    item_col = next((c for c, l in lc.items() if l in POSSIBLE_NAMES), df.columns[0])
 
     # 2. FAST DATA CLEANING
     if price_col:
-        df['clean_price'] = pd.to_numeric(
-            df[price_col].astype(str).str.replace(r'[^\d]', '', regex=True), 
-            errors='coerce'
-        )
+        prices = df[price_col].astype(STRING_DTYPE)
+        df['clean_price'] = pd.to_numeric(prices.str.replace(r'\D+', '', regex=True), errors='coerce')
         df_clean = df.dropna(subset=['clean_price'])
     else:
         df_clean = df
@@ -114,65 +158,209 @@ def plot_category_stats_lite(df, category_name):
     with c1:
         st.subheader("Top Locations")
         if address_col:
-            st.bar_chart(df[address_col].value_counts().head(10))
+            st.bar_chart(top_counts(filename, address_col))
         else:
             st.info(f"Address column not found.")
 
     with c2:
         st.subheader(f"Top Items ({item_col})")
-        st.bar_chart(df[item_col].value_counts().head(10))
+        st.bar_chart(top_counts(filename, item_col))
 
     st.markdown("---")
     
     # 5. PRICE DISTRIBUTION
     st.subheader("Price Distribution")
     if price_col and not df_clean.empty:
-        fig, ax = plt.subplots(figsize=(8, 3))
-        ax.hist(df_clean['clean_price'], bins=30, color='skyblue', edgecolor='black')
-        ax.set_title("Price Range Distribution")
-        ax.set_xlabel("Price (CFA)")
-        ax.grid(axis='y', alpha=0.5)
-        st.pyplot(fig)
-        plt.close(fig)
+        # Bin with NumPy and use Streamlit's native chart instead of rendering a matplotlib figure
+        prices = df_clean['clean_price'].to_numpy(dtype=np.float64, copy=False)
+        # Whole-CFA bin edges give readable tick labels; np.unique merges edges that a narrow
+        # price range would round onto each other, so labels never collide
+        lo, hi = np.floor(prices.min()), np.floor(prices.max()) + 1
+        edges = np.unique(np.linspace(lo, hi, 31).astype(np.int64))
+        counts, edges = np.histogram(prices, bins=edges)
+        hist = pd.DataFrame({'Count': counts}, index=pd.Index(edges[:-1], name='Price (CFA)'))
+        st.caption("Price Range Distribution")
+        st.bar_chart(hist, x_label="Price (CFA)", y_label="Count")
     else:
         st.info("No valid price data available for plotting.")
 
 # --- SCRAPING FUNCTION ---
-def scrape_data(url_base, table_name, db_name, csv_name, user_pages, max_limit):
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+MAX_CONCURRENCY = 20
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+MAX_RETRY_AFTER = 30
+MAX_PARSE_WORKERS = 4
+
+class RateLimiter:
+    # Token bucket: refills `rate` tokens per second, each request spends one
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def connect_db(db_name):
+    # Ingest-only database: skip fsync and keep the journal/temp data in memory.
+    # Switch journal_mode to WAL if the database ever needs concurrent readers.
     conn = sqlite3.connect(db_name)
+    conn.execute('PRAGMA synchronous=OFF')
+    conn.execute('PRAGMA journal_mode=MEMORY')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-64000')
+    return conn
+
+async def fetch_page(session, url, limiter):
+    # Retry transient failures (connection errors, timeouts, 429/5xx) with exponential backoff;
+    # other HTTP errors such as 403/404 will not change on retry and are raised at once
+    for attempt in range(MAX_RETRIES + 1):
+        await limiter.acquire()
+        delay = BACKOFF_FACTOR * 2 ** attempt
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as res:
+                if res.status < 400:
+                    return await res.read()
+                retryable = res.status == 429 or res.status >= 500
+                retry_after = res.headers.get('Retry-After', '')
+                if res.status == 429 and retry_after.isdigit():
+                    # Waiting holds a concurrency slot (and the script run), so a server asking
+                    # for more than MAX_RETRY_AFTER seconds fails the page instead
+                    retryable = int(retry_after) <= MAX_RETRY_AFTER
+                    delay = max(delay, int(retry_after))
+                if attempt == MAX_RETRIES or not retryable:
+                    res.raise_for_status()
+        except aiohttp.ClientResponseError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+        await asyncio.sleep(delay)
+
+async def fetch_and_parse(session, url, sem, limiter, pool, errors):
+    # The semaphore is held until the page is parsed, so at most MAX_CONCURRENCY
+    # page bodies are in memory at once instead of every downloaded-but-unparsed page
+    async with sem:
+        try:
+            content = await fetch_page(session, url, limiter)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            errors.append(f"{url}: {e!r}")
+            return None
+        # Parsing is CPU-bound, so it runs in a worker process while other pages download
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, parse_page, content)
+        except BrokenProcessPool as e:
+            # A dead worker breaks the executor for good; drop it so the next scrape starts a fresh one
+            get_parse_pool.clear()
+            errors.append(f"{url}: {e!r}")
+            return None
+
+# One parse pool per server process, shared by every scrape. The Streamlit server is
+# multi-threaded, so workers are spawned rather than forked; each one re-imports this
+# script, so the pool is kept small.
+@st.cache_resource
+def get_parse_pool():
+    workers = min(os.cpu_count() or 1, MAX_PARSE_WORKERS)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+async def scrape_data_async(url_base, table_name, db_name, csv_name, user_pages, max_limit, requests_per_second):
+    conn = connect_db(db_name)
     c = conn.cursor()
     c.execute(f'''CREATE TABLE IF NOT EXISTS {table_name} (type_item TEXT, price TEXT, address TEXT, image_link TEXT)''')
+    # Deduplicate in SQL: the first time the unique index is created, clear repeats left by
+    # earlier runs (the index cannot be built over them); afterwards it rejects new ones
+    index_name = f'uq_{table_name}'
+    if c.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name=?", (index_name,)).fetchone() is None:
+        c.execute(f'''DELETE FROM {table_name} WHERE rowid NOT IN
+                      (SELECT MIN(rowid) FROM {table_name} GROUP BY type_item, price, address, image_link)''')
+        c.execute(f'CREATE UNIQUE INDEX {index_name} ON {table_name}(type_item, price, address, image_link)')
+        conn.commit()
+    insert_sql = f'INSERT OR IGNORE INTO {table_name} VALUES(?,?,?,?)'
     
     actual_pages = min(user_pages, max_limit)
     progress_text = f"Scraping {table_name} (Target: {actual_pages} pages)..."
     my_bar = st.progress(0, text=progress_text)
     
-    for index in range(1, actual_pages + 1):
-        try:
-            res = get(f'{url_base}?page={index}')
-            soup = bs(res.content, 'html.parser')
-            containers = soup.find_all('div', 'col s6 m4 l3')
-            for container in containers:
-                try:
-                    t = container.find('p', 'ad__card-description').text.strip()
-                    p = container.find('p', 'ad__card-price').text.replace('CFA', '').replace(' ', '')
-                    a = container.find('p', 'ad__card-location').span.text.strip()
-                    i = container.find('img', 'ad__card-img').get('src')
-                    c.execute(f'INSERT INTO {table_name} VALUES(?,?,?,?)', (t, p, a, i))
-                except: pass
-            conn.commit()
-        except: pass
-        my_bar.progress(index / actual_pages, text=f"Scraping page {index}/{actual_pages}")
+    # Fetch all pages concurrently (bounded by the semaphore) and parse them as they arrive
+    urls = [f'{url_base}?page={index}' for index in range(1, actual_pages + 1)]
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    limiter = RateLimiter(requests_per_second)
+    rows = []
+    # Collected per scrape, rendered below and returned so failed scrapes are not cached
+    errors = []
+    try:
+        pool = get_parse_pool()
+        # Pooled keep-alive connections reuse the TLS handshake across pages
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY, keepalive_timeout=30)
+        async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+            tasks = [fetch_and_parse(session, url, sem, limiter, pool, errors) for url in urls]
+            for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                page_rows = await task
+                if page_rows is not None:
+                    rows.extend(page_rows)
+                my_bar.progress(done / actual_pages, text=f"Scraping page {done}/{actual_pages}")
         
-    df = pd.read_sql_query(f'SELECT * FROM {table_name}', conn)
-    conn.close()
-    my_bar.empty()
+        # Single transaction for all rows instead of one commit per page
+        c.execute('BEGIN')
+        c.executemany(insert_sql, rows)
+        conn.commit()
+            
+        df = pd.read_sql_query(f'SELECT * FROM {table_name}', conn)
+    finally:
+        conn.close()
+        my_bar.empty()
+    if errors:
+        st.warning(f"{len(errors)}/{actual_pages} pages of {table_name} could not be fetched.")
+        with st.expander("Fetch errors"):
+            st.code('\n'.join(errors))
     
     if not df.empty:
+        df['price'] = df['price'].astype(STRING_DTYPE).str.replace(r'CFA|\s', '', regex=True)
+        # The index misses rows stored with pre-stripped prices by older runs and rows with a
+        # NULL image_link (NULLs never collide in a UNIQUE index), so finish the job here
         df.drop_duplicates(inplace=True)
-        df.to_csv(csv_name, index=False)
+        df.to_csv(csv_name, index=False, chunksize=50000)
+        try:
+            df.to_parquet(csv_name.replace('.csv', '.parquet'), compression='zstd', index=False)
+        except ImportError:
+            pass
+    return df, errors
+
+def scrape_data(url_base, table_name, db_name, csv_name, user_pages, max_limit, requests_per_second):
+    return asyncio.run(scrape_data_async(url_base, table_name, db_name, csv_name, user_pages, max_limit, requests_per_second))
+
+class PartialScrapeError(Exception):
+    # Raised out of cached_scrape when pages failed: st.cache_data does not cache
+    # exceptions, so the next rerun retries instead of replaying a partial frame
+    def __init__(self, df):
+        super().__init__("scrape finished with fetch errors")
+        self.df = df
+
+# Widget changes rerun the whole script; reuse the last scrape for the same inputs for an hour.
+# The throttle is left out of the cache key (leading underscore) so moving it doesn't re-scrape.
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_scrape(url_base, table_name, db_name, csv_name, user_pages, max_limit, _requests_per_second):
+    df, errors = scrape_data(url_base, table_name, db_name, csv_name, user_pages, max_limit, _requests_per_second)
+    if errors:
+        raise PartialScrapeError(df)
     return df
 
+def scrape_category(url_base, table_name, db_name, csv_name, user_pages, max_limit, requests_per_second):
+    try:
+        return cached_scrape(url_base, table_name, db_name, csv_name, user_pages, max_limit, requests_per_second)
+    except PartialScrapeError as e:
+        return e.df
+
 # --- FUNCTION: LOAD USER FILES ---
 def load_my_scraped_files():
     st.markdown("<h3 style='text-align: center;'>My Local Scraped Files</h3>", unsafe_allow_html=True)
@@ -192,106 +380,111 @@ def load_my_scraped_files():
             st.warning(f"File '{filename}' not found in project folder.")
 
 # --- MAIN APP LOGIC ---
-st.sidebar.header('User Input Features')
-
-# Slider capped at 120, but scraping logic limits children items to 22/8 automatically
-Pages = st.sidebar.slider('Pages to scrape', 1, 120, 1)
-
-Choices = st.sidebar.selectbox('Options', [
-    'Scrape data using beautifulSoup', 
-    'Download scraped data', 
-    'Load My Scraped Files', 
-    'Dashbord of the data', 
-    'Evaluate the App'
-])
-
-add_bg_from_local('img_file3.jpg') 
-local_css('style.css')  
-
-# 1. SCRAPE
-if Choices == 'Scrape data using beautifulSoup':
-    st.info(f"Scraping started. Max pages set to user input ({Pages}), capped by category limits.")
+# Skipped in parse workers, where it would render the app or start a nested scrape
+if not IS_PARSE_WORKER:
+    st.sidebar.header('User Input Features')
+
+    # Slider capped at 120, but scraping logic limits children items to 22/8 automatically
+    Pages = st.sidebar.slider('Pages to scrape', 1, 120, 1)
+
+    # Throttle requests so Coinafrique does not start answering with 429s mid-scrape
+    Requests_per_second = st.sidebar.slider('Requests per second', 1, 20, 10)
+
+    Choices = st.sidebar.selectbox('Options', [
+        'Scrape data using selectolax', 
+        'Download scraped data', 
+        'Load My Scraped Files', 
+        'Dashbord of the data', 
+        'Evaluate the App'
+    ])
+
+    add_bg_from_local('img_file3.jpg') 
+    local_css('style.css')  
+
+    # 1. SCRAPE
+    if Choices == 'Scrape data using selectolax':
+        st.info(f"Scraping started. Max pages set to user input ({Pages}), capped by category limits.")
     
-    st.markdown("### 1. Men's Clothes")
-    df_mc = scrape_data('https://sn.coinafrique.com/categorie/vetements-homme', 
-                        'mens_clothes_tab', 'mens_clothes.db', 'mens_clothes_clean_data.csv', Pages, 119)
-    load(df_mc, 'Men Clothes Data', 'scr_dl_1', 'scr_btn_1')
-
-    st.markdown("### 2. Men's Shoes")
-    df_ms = scrape_data('https://sn.coinafrique.com/categorie/chaussures-homme', 
-                        'mens_shoes_tab', 'mens_shoes.db', 'mens_shoes_clean_data.csv', Pages, 119)
-    load(df_ms, 'Men Shoes Data', 'scr_dl_2', 'scr_btn_2')
-
-    st.markdown("### 3. Children's Clothes")
-    df_cc = scrape_data('https://sn.coinafrique.com/categorie/vetements-enfants', 
-                        'children_clothes_tab', 'children_clothes.db', 'children_clothes_clean_data.csv', Pages, 22)
-    load(df_cc, 'Children Clothes Data', 'scr_dl_3', 'scr_btn_3')
-
-    st.markdown("### 4. Children's Shoes")
-    df_cs = scrape_data('https://sn.coinafrique.com/categorie/chaussures-enfants', 
-                        'children_shoes_tab', 'children_shoes.db', 'children_shoes_clean_data.csv', Pages, 8)
-    load(df_cs, 'Children Shoes Data', 'scr_dl_4', 'scr_btn_4')
-
-# 2. DOWNLOAD SCRAPED
-elif Choices == 'Download scraped data': 
-    st.header("Download Recently Scraped Data")
-    files = [
-        ('mens_clothes_clean_data.csv', 'Mens Clothes Data', 'dl_1', 'btn_1'),
-        ('mens_shoes_clean_data.csv', 'Mens Shoes Data', 'dl_2', 'btn_2'),
-        ('children_clothes_clean_data.csv', 'Children Clothes Data', 'dl_3', 'btn_3'),
-        ('children_shoes_clean_data.csv', 'Children Shoes Data', 'dl_4', 'btn_4')
-    ]
-    for f, title, k, b in files:
-        df = load_csv_data(f)
-        if not df.empty:
-            load(df, title, k, b)
-            st.write("---")
-        else:
-            st.warning(f"File {f} not found. Please scrape data first.")
+        st.markdown("### 1. Men's Clothes")
+        df_mc = scrape_category('https://sn.coinafrique.com/categorie/vetements-homme', 
+                                'mens_clothes_tab', 'mens_clothes.db', 'mens_clothes_clean_data.csv', Pages, 119, Requests_per_second)
+        load(df_mc, 'Men Clothes Data', 'scr_dl_1', 'scr_btn_1')
+
+        st.markdown("### 2. Men's Shoes")
+        df_ms = scrape_category('https://sn.coinafrique.com/categorie/chaussures-homme', 
+                                'mens_shoes_tab', 'mens_shoes.db', 'mens_shoes_clean_data.csv', Pages, 119, Requests_per_second)
+        load(df_ms, 'Men Shoes Data', 'scr_dl_2', 'scr_btn_2')
+
+        st.markdown("### 3. Children's Clothes")
+        df_cc = scrape_category('https://sn.coinafrique.com/categorie/vetements-enfants', 
+                                'children_clothes_tab', 'children_clothes.db', 'children_clothes_clean_data.csv', Pages, 22, Requests_per_second)
+        load(df_cc, 'Children Clothes Data', 'scr_dl_3', 'scr_btn_3')
+
+        st.markdown("### 4. Children's Shoes")
+        df_cs = scrape_category('https://sn.coinafrique.com/categorie/chaussures-enfants', 
+                                'children_shoes_tab', 'children_shoes.db', 'children_shoes_clean_data.csv', Pages, 8, Requests_per_second)
+        load(df_cs, 'Children Shoes Data', 'scr_dl_4', 'scr_btn_4')
+
+    # 2. DOWNLOAD SCRAPED
+    elif Choices == 'Download scraped data': 
+        st.header("Download Recently Scraped Data")
+        files = [
+            ('mens_clothes_clean_data.csv', 'Mens Clothes Data', 'dl_1', 'btn_1'),
+            ('mens_shoes_clean_data.csv', 'Mens Shoes Data', 'dl_2', 'btn_2'),
+            ('children_clothes_clean_data.csv', 'Children Clothes Data', 'dl_3', 'btn_3'),
+            ('children_shoes_clean_data.csv', 'Children Shoes Data', 'dl_4', 'btn_4')
+        ]
+        for f, title, k, b in files:
+            df = load_csv_data(f)
+            if not df.empty:
+                load(df, title, k, b)
+                st.write("---")
+            else:
+                st.warning(f"File {f} not found. Please scrape data first.")
 
-# 3. LOAD LOCAL FILES
-elif Choices == 'Load My Scraped Files':
-    load_my_scraped_files()
+    # 3. LOAD LOCAL FILES
+    elif Choices == 'Load My Scraped Files':
+        load_my_scraped_files()
 
-# 4. DASHBOARD
-elif  Choices == 'Dashbord of the data': 
-    st.header("Dashboard Analytics")
-    tab1, tab2, tab3, tab4 = st.tabs(["Men's Clothes", "Men's Shoes", "Kids Clothes", "Kids Shoes"])
+    # 4. DASHBOARD
+    elif  Choices == 'Dashbord of the data': 
+        st.header("Dashboard Analytics")
+        tab1, tab2, tab3, tab4 = st.tabs(["Men's Clothes", "Men's Shoes", "Kids Clothes", "Kids Shoes"])
     
-    files_map = {
-        "Men's Clothes": ["men_clothes.csv", "mens_clothes_clean_data.csv"],
-        "Men's Shoes": ["men_shoes.csv", "mens_shoes_clean_data.csv"],
-        "Kids Clothes": ["children_clothes.csv", "children_clothes_clean_data.csv"],
-        "Kids Shoes": ["children_shoes.csv", "children_shoes_clean_data.csv"]
-    }
-
-    def safe_plot(tab, name, filename_list):
-        with tab:
-            df = pd.DataFrame()
-            used_file = ""
-            for fname in filename_list:
-                if os.path.exists(fname):
-                    df = load_csv_data(fname)
-                    used_file = fname
-                    break
+        files_map = {
+            "Men's Clothes": ["men_clothes.csv", "mens_clothes_clean_data.csv"],
+            "Men's Shoes": ["men_shoes.csv", "mens_shoes_clean_data.csv"],
+            "Kids Clothes": ["children_clothes.csv", "children_clothes_clean_data.csv"],
+            "Kids Shoes": ["children_shoes.csv", "children_shoes_clean_data.csv"]
+        }
+
+        def safe_plot(tab, name, filename_list):
+            with tab:
+                df = pd.DataFrame()
+                used_file = ""
+                for fname in filename_list:
+                    if os.path.exists(fname):
+                        df = load_csv_data(fname).copy()
+                        used_file = fname
+                        break
             
-            if not df.empty:
-                st.caption(f"Visualizing data from: {used_file}")
-                plot_category_stats_lite(df, name)
-            else:
-                st.warning(f"No data found for {name}. (Looked for: {', '.join(filename_list)})")
-
-    safe_plot(tab1, "Men's Clothes", files_map["Men's Clothes"])
-    safe_plot(tab2, "Men's Shoes", files_map["Men's Shoes"])
-    safe_plot(tab3, "Kids Clothes", files_map["Kids Clothes"])
-    safe_plot(tab4, "Kids Shoes", files_map["Kids Shoes"])
-
-# 5. EVALUATE
-else:
-    st.markdown("<h3 style='text-align: center;'>Give your Feedback</h3>", unsafe_allow_html=True)
-    col1, col2 = st.columns(2)
-    with col1:
-        st.link_button("Kobo Evaluation Form", "https://ee.kobotoolbox.org/x/yc2vAerV")
-    with col2:
-        st.link_button("Google Forms Evaluation", "https://docs.google.com/forms/d/e/1FAIpQLSdgKBZpH9Lj6Ot0_4HT41gvD0yNpKSOjw3tOhih5uL5p5aWiQ/viewform?usp=header")
+                if not df.empty:
+                    st.caption(f"Visualizing data from: {used_file}")
+                    plot_category_stats_lite(df, name, used_file)
+                else:
+                    st.warning(f"No data found for {name}. (Looked for: {', '.join(filename_list)})")
+
+        safe_plot(tab1, "Men's Clothes", files_map["Men's Clothes"])
+        safe_plot(tab2, "Men's Shoes", files_map["Men's Shoes"])
+        safe_plot(tab3, "Kids Clothes", files_map["Kids Clothes"])
+        safe_plot(tab4, "Kids Shoes", files_map["Kids Shoes"])
+
+    # 5. EVALUATE
+    else:
+        st.markdown("<h3 style='text-align: center;'>Give your Feedback</h3>", unsafe_allow_html=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.link_button("Kobo Evaluation Form", "https://ee.kobotoolbox.org/x/yc2vAerV")
+        with col2:
+            st.link_button("Google Forms Evaluation", "https://docs.google.com/forms/d/e/1FAIpQLSdgKBZpH9Lj6Ot0_4HT41gvD0yNpKSOjw3tOhih5uL5p5aWiQ/viewform?usp=header")
     
\ No newline at end of file
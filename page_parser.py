@@ -0,0 +1,19 @@
+from selectolax.parser import HTMLParser
+
+# Kept outside my_data_app.py so ProcessPoolExecutor workers can unpickle it by
+# module name. Spawned workers still re-run my_data_app.py as __mp_main__, which is
+# why that script skips its Streamlit UI when IS_PARSE_WORKER is set.
+def parse_page(content):
+    rows = []
+    # selectolax decodes the raw bytes itself, avoiding a full decoded copy of the page
+    tree = HTMLParser(content)
+    for container in tree.css('div.col.s6.m4.l3'):
+        t_el = container.css_first('p.ad__card-description')
+        p_el = container.css_first('p.ad__card-price')
+        a_el = container.css_first('p.ad__card-location span')
+        i_el = container.css_first('img.ad__card-img')
+        # Skip cards with a missing field instead of raising and swallowing per card
+        if t_el is None or p_el is None or a_el is None or i_el is None:
+            continue
+        rows.append((t_el.text().strip(), p_el.text().strip(), a_el.text().strip(), i_el.attributes.get('src')))
+    return rows